@@ -12,10 +12,12 @@ import argparse
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Allow running from project root
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.data.simulator import generate_raw_data, prepare_cohort_data
+from src.data.simulator import generate_and_aggregate
 from src.models.causal import CausalAnalysis
 from src.utils import load_config, print_section
 
@@ -54,19 +56,22 @@ def main() -> None:
 
     # --- Data Generation ---
     print_section("Data Generation")
-    raw = generate_raw_data(
+    cohort = generate_and_aggregate(
         num_users=sim_cfg["num_users"],
         num_months=sim_cfg["num_months"],
         base_spend_lambda=sim_cfg["base_spend_lambda"],
         month_decay_rate=sim_cfg["month_decay_rate"],
         treatment_effect=sim_cfg["treatment_effect"],
+        signup_month=sim_cfg["signup_month"],
         seed=args.seed,
     )
-    print(f"Generated {len(raw):,} observations for {sim_cfg['num_users']:,} users.")
+    num_obs = sim_cfg["num_users"] * sim_cfg["num_months"]
+    print(f"Generated {num_obs:,} observations for {sim_cfg['num_users']:,} users.")
 
-    cohort = prepare_cohort_data(raw, signup_month=sim_cfg["signup_month"])
     print(f"Cohort data: {len(cohort):,} users (month={sim_cfg['signup_month']}).")
-    print(f"  Treatment: {cohort.treatment.sum():,}  |  Control: {(~cohort.treatment).sum():,}")
+    n_treat = np.count_nonzero(cohort.treatment.to_numpy())
+    n_ctrl = len(cohort) - n_treat
+    print(f"  Treatment: {n_treat:,}  |  Control: {n_ctrl:,}")
 
     # --- Causal Analysis ---
     print_section("Causal Identification & Estimation")
@@ -1,3 +1,7 @@
 """Data generation and processing modules."""
 
-from src.data.simulator import generate_raw_data, prepare_cohort_data
+from src.data.simulator import (
+    generate_and_aggregate,
+    generate_raw_data,
+    prepare_cohort_data,
+)
@@ -7,9 +7,17 @@ post-enrollment.
 
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 
+_PANEL_COLUMNS: tuple[str, ...] = ("user_id", "signup_month", "month", "spend", "treatment")
+
+_POISSON_BLOCK: int = 1 << 20
+
 
 def generate_raw_data(
     num_users: int = 10_000,
@@ -35,32 +43,174 @@ def generate_raw_data(
         seed: Optional random seed for reproducibility.
 
     Returns:
-        DataFrame with columns ``user_id``, ``signup_month``, ``month``,
-        ``spend``, and ``treatment``.
+        DataFrame with columns ``user_id`` (int32), ``signup_month`` and
+        ``month`` (int16), ``spend``, and ``treatment`` (bool).  ``spend`` is
+        int32, or float64 if *month_decay_rate* or *treatment_effect* is not
+        a whole number.
     """
-    rng = np.random.default_rng(seed)
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+    users = _simulate_users(
+        rng,
+        num_users,
+        num_months,
+        base_spend_lambda,
+        month_decay_rate,
+        treatment_effect,
+    )
+    return pd.DataFrame(_expand_panel(users, num_months), copy=False)
+
 
-    signup_months = (
-        rng.choice(np.arange(1, num_months), num_users)
-        * rng.integers(0, 2, size=num_users)
+def generate_and_aggregate(
+    num_users: int = 10_000,
+    num_months: int = 12,
+    base_spend_lambda: int = 500,
+    month_decay_rate: int = 10,
+    treatment_effect: int = 100,
+    signup_month: int = 3,
+    seed: int | None = None,
+    chunk_size: int = 50_000,
+) -> pd.DataFrame:
+    """Simulate users in chunks and reduce each chunk straight to a cohort.
+
+    Equivalent to :func:`generate_raw_data` followed by
+    :func:`prepare_cohort_data`, but only *chunk_size* users' panel rows are
+    alive at any time, so peak memory is bounded by the chunk rather than by
+    *num_users*.  For a given seed the result is identical to the two-step
+    path when ``chunk_size >= num_users``.
+
+    Args:
+        num_users: Number of unique customers.
+        num_months: Number of observation months (1-indexed).
+        base_spend_lambda: Poisson λ for baseline monthly spend.
+        month_decay_rate: Linear spend decay per month.
+        treatment_effect: Additive spend lift after enrollment.
+        signup_month: The enrollment month to isolate.
+        seed: Optional random seed for reproducibility.
+        chunk_size: Number of users simulated per chunk.
+
+    Returns:
+        Cohort DataFrame as returned by :func:`prepare_cohort_data`.
+    """
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+
+    # An empty population still runs one (empty) chunk to keep the schema.
+    chunk_starts = range(0, num_users, chunk_size) or range(1)
+
+    chunks = []
+    for first_user in chunk_starts:
+        users = _simulate_users(
+            rng,
+            min(chunk_size, num_users - first_user),
+            num_months,
+            base_spend_lambda,
+            month_decay_rate,
+            treatment_effect,
+            first_user=first_user,
+        )
+        chunks.append(_aggregate_blocks(users, num_months, signup_month))
+
+    return pd.DataFrame(
+        {col: np.concatenate([chunk[col] for chunk in chunks]) for col in chunks[0]}
     )
 
-    df = pd.DataFrame(
-        {
-            "user_id": np.repeat(np.arange(num_users), num_months),
-            "signup_month": np.repeat(signup_months, num_months),
-            "month": np.tile(np.arange(1, num_months + 1), num_users),
-            "spend": rng.poisson(base_spend_lambda, num_users * num_months),
-        }
+
+def _simulate_users(
+    rng: np.random.Generator,
+    num_users: int,
+    num_months: int,
+    base_spend_lambda: int,
+    month_decay_rate: int,
+    treatment_effect: int,
+    first_user: int = 0,
+) -> dict[str, np.ndarray]:
+    """Draw users ``first_user .. first_user + num_users`` in wide form.
+
+    Returns per-user ``user_id``, ``signup_month`` and ``treatment`` arrays
+    plus a ``(users, months)`` ``spend`` matrix.
+    """
+    # One draw over 2 * (num_months - 1) outcomes: the lower half maps to a
+    # signup month in [1, num_months - 1], the upper half to "never enrolled".
+    draws = rng.integers(0, 2 * (num_months - 1), size=num_users, dtype=np.int16)
+    signup_months = np.where(draws < num_months - 1, draws + 1, 0)
+    user_treatment = signup_months > 0
+    # Last month without the lift; never-enrolled users are never lifted.
+    lift_after = np.where(user_treatment, signup_months, num_months)
+
+    months = _month_index(num_months)
+    spend = _poisson(rng, base_spend_lambda, num_users * num_months)
+    if _is_whole(month_decay_rate) and _is_whole(treatment_effect):
+        # Whole-valued floats (e.g. 10.0 from YAML) must become Python ints,
+        # or they refuse to cast into the int32 ufunc dtype/out below.
+        month_decay_rate = int(month_decay_rate)
+        treatment_effect = int(treatment_effect)
+    else:
+        spend = spend.astype(np.float64)
+
+    # Apply decay and lift in place, broadcasting the per-month and per-user
+    # terms instead of materialising panel-sized temporaries.
+    spend_mat = spend.reshape(num_users, num_months)
+    spend_mat -= np.multiply(months, month_decay_rate, dtype=spend.dtype)
+    np.add(
+        spend_mat,
+        treatment_effect,
+        out=spend_mat,
+        where=lift_after[:, None] < months,
     )
 
-    df["treatment"] = df["signup_month"] > 0
-    df["spend"] = df["spend"] - df["month"] * month_decay_rate
+    return {
+        "user_id": np.arange(first_user, first_user + num_users, dtype=np.int32),
+        "signup_month": signup_months,
+        "treatment": user_treatment,
+        "spend": spend_mat,
+    }
+
+
+def _expand_panel(users: dict[str, np.ndarray], num_months: int) -> dict[str, np.ndarray]:
+    """Expand :func:`_simulate_users` output to long ``(user, month)`` rows."""
+    num_users = len(users["user_id"])
+    return {
+        "user_id": np.repeat(users["user_id"], num_months),
+        "signup_month": np.repeat(users["signup_month"], num_months),
+        "month": np.tile(_month_index(num_months), num_users),
+        "spend": users["spend"].reshape(-1),
+        "treatment": np.repeat(users["treatment"], num_months),
+    }
+
+
+def _is_whole(value: float) -> bool:
+    """Whether *value* can be applied to int32 spend without loss."""
+    return float(value).is_integer()
+
+
+@functools.lru_cache(maxsize=16)
+def _month_index(num_months: int) -> np.ndarray:
+    """Read-only ``1..num_months`` month index, shared across calls."""
+    months = np.arange(1, num_months + 1, dtype=np.int16)
+    months.flags.writeable = False
+    return months
 
-    after_signup = (df["signup_month"] < df["month"]) & df["treatment"]
-    df.loc[after_signup, "spend"] = df.loc[after_signup, "spend"] + treatment_effect
 
-    return df
+def _poisson(rng: np.random.Generator, lam: float, size: int) -> np.ndarray:
+    """Draw *size* int32 Poisson(*lam*) samples, threading large draws.
+
+    Draws above ``_POISSON_BLOCK`` are split into fixed-size blocks, each
+    sampled by its own child generator in a thread pool (NumPy releases the
+    GIL while sampling).  The output depends only on *rng*, not on the number
+    of threads.
+    """
+    if size <= _POISSON_BLOCK:
+        return rng.poisson(lam, size).astype(np.int32)
+
+    out = np.empty(size, dtype=np.int32)
+    starts = range(0, size, _POISSON_BLOCK)
+
+    def fill(child: np.random.Generator, start: int) -> None:
+        stop = min(start + _POISSON_BLOCK, size)
+        out[start:stop] = child.poisson(lam, stop - start)
+
+    with ThreadPoolExecutor(max_workers=min(len(starts), os.cpu_count() or 1)) as pool:
+        list(pool.map(fill, rng.spawn(len(starts)), starts))
+    return out
 
 
 def prepare_cohort_data(
@@ -72,28 +222,161 @@ def prepare_cohort_data(
     Filters to users who either signed up in *signup_month* or never signed up,
     then computes mean spend before and after that month per user.
 
+    Rows are sorted by ``(user_id, month)`` if they are not already, so each
+    user is a contiguous run.  Balanced panels (every user observed in the same
+    months, as produced by :func:`generate_raw_data`) are reduced as a dense
+    ``(users, months)`` matrix; anything else is reduced run by run.
+
     Args:
         df: Raw panel DataFrame from :func:`generate_raw_data`.
         signup_month: The enrollment month to isolate.
 
     Returns:
         DataFrame with columns ``user_id``, ``signup_month``, ``treatment``,
-        ``pre_spends``, and ``post_spends``.
+        ``pre_spends``, and ``post_spends`` (float32 means).
     """
-    cohort = df[df.signup_month.isin([0, signup_month])].copy()
-
-    aggregated = (
-        cohort.groupby(["user_id", "signup_month", "treatment"])
-        .apply(
-            lambda x: pd.Series(
-                {
-                    "pre_spends": x.loc[x.month < signup_month, "spend"].mean(),
-                    "post_spends": x.loc[x.month > signup_month, "spend"].mean(),
-                }
-            ),
-            include_groups=False,
-        )
-        .reset_index()
-    )
+    panel = {col: df[col].to_numpy() for col in _PANEL_COLUMNS}
+    return pd.DataFrame(_aggregate_cohort(panel, signup_month))
+
+
+def _aggregate_cohort(
+    panel: dict[str, np.ndarray],
+    signup_month: int,
+) -> dict[str, np.ndarray]:
+    """Filter *panel* to the cohort and reduce it to per-user columns."""
+    signup = panel["signup_month"]
+    keep = (signup == 0) | (signup == signup_month)
+    cohort = _sort_panel({col: values[keep] for col, values in panel.items()})
+    starts = _run_starts(cohort["user_id"])
+
+    aggregated = _aggregate_balanced(cohort, starts, signup_month)
+    if aggregated is None:
+        aggregated = _aggregate_runs(cohort, starts, signup_month)
 
     return aggregated
+
+
+def _aggregate_blocks(
+    users: dict[str, np.ndarray],
+    num_months: int,
+    signup_month: int,
+) -> dict[str, np.ndarray]:
+    """Reduce wide :func:`_simulate_users` output straight to a cohort.
+
+    The cohort is selected per user and the spend matrix is reduced directly,
+    skipping the long-form expansion and the sort, run and balance checks of
+    :func:`_aggregate_cohort`.
+    """
+    signup = users["signup_month"]
+    keep = (signup == 0) | (signup == signup_month)
+    pre_spends, post_spends = _window_means(
+        users["spend"][keep], _month_index(num_months), signup_month
+    )
+
+    return {
+        "user_id": users["user_id"][keep],
+        "signup_month": signup[keep],
+        "treatment": users["treatment"][keep],
+        "pre_spends": pre_spends,
+        "post_spends": post_spends,
+    }
+
+
+def _sort_panel(panel: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Return *panel* ordered by ``(user_id, month)``, sorting only if needed."""
+    user_id = panel["user_id"]
+    month = panel["month"]
+
+    is_sorted = (user_id[1:] > user_id[:-1]) | (
+        (user_id[1:] == user_id[:-1]) & (month[1:] > month[:-1])
+    )
+    if is_sorted.all():
+        return panel
+    order = np.lexsort((month, user_id))
+    return {col: values[order] for col, values in panel.items()}
+
+
+def _run_starts(user_id: np.ndarray) -> np.ndarray:
+    """Offsets at which each run of equal *user_id* values begins."""
+    if len(user_id) == 0:
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.r_[True, user_id[1:] != user_id[:-1]])
+
+
+def _aggregate_balanced(
+    cohort: dict[str, np.ndarray],
+    starts: np.ndarray,
+    signup_month: int,
+) -> dict[str, np.ndarray] | None:
+    """Reduce a balanced panel via a ``(users, months)`` reshape.
+
+    Returns ``None`` if *cohort* is empty or not balanced.
+    """
+    if len(starts) == 0:
+        return None
+
+    n_users = len(starts)
+    n_months, remainder = divmod(len(cohort["user_id"]), n_users)
+    if remainder or not (np.diff(starts) == n_months).all():
+        return None
+
+    month_mat = cohort["month"].reshape(n_users, n_months)
+    if not (month_mat == month_mat[0]).all():
+        return None
+
+    spend_mat = cohort["spend"].reshape(n_users, n_months)
+    pre_spends, post_spends = _window_means(spend_mat, month_mat[0], signup_month)
+
+    return _cohort_columns(cohort, starts, pre_spends, post_spends)
+
+
+def _window_means(
+    spend_mat: np.ndarray,
+    months: np.ndarray,
+    signup_month: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise pre/post means of *spend_mat* in a single matmul pass.
+
+    Each column of the ``(months, 2)`` weight matrix averages the months on
+    one side of *signup_month*; a side with no months yields NaN.
+    """
+    windows = np.stack([months < signup_month, months > signup_month], axis=1)
+    with np.errstate(invalid="ignore"):
+        weights = (windows / windows.sum(axis=0)).astype(np.float32)
+    means = np.matmul(spend_mat, weights, dtype=np.float32)
+    return means[:, 0], means[:, 1]
+
+
+def _aggregate_runs(
+    cohort: dict[str, np.ndarray],
+    starts: np.ndarray,
+    signup_month: int,
+) -> dict[str, np.ndarray]:
+    """Reduce an arbitrary sorted panel with ``np.add.reduceat`` over user runs."""
+    month = cohort["month"]
+    spend = cohort["spend"]
+
+    means = []
+    for window in (month < signup_month, month > signup_month):
+        total = np.add.reduceat(np.where(window, spend, 0), starts, dtype=np.float64)
+        count = np.add.reduceat(window, starts, dtype=np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means.append((total / count).astype(np.float32))
+
+    return _cohort_columns(cohort, starts, *means)
+
+
+def _cohort_columns(
+    cohort: dict[str, np.ndarray],
+    starts: np.ndarray,
+    pre_spends: np.ndarray,
+    post_spends: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Assemble the per-user cohort columns from each run's first row."""
+    return {
+        "user_id": cohort["user_id"][starts],
+        "signup_month": cohort["signup_month"][starts],
+        "treatment": cohort["treatment"][starts],
+        "pre_spends": pre_spends,
+        "post_spends": post_spends,
+    }
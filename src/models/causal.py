@@ -7,11 +7,17 @@ refutation testing.
 
 from __future__ import annotations
 
+import copy
+import functools
 from dataclasses import dataclass, field
 from typing import Any
 
 import dowhy
 import pandas as pd
+from dowhy.causal_estimator import estimate_effect
+from joblib import Parallel, cpu_count, delayed
+
+from src.models._psm import FastPropensityScoreMatchingEstimator
 
 
 CAUSAL_GRAPH: str = """digraph {
@@ -25,6 +31,38 @@ CAUSAL_GRAPH: str = """digraph {
     signup_month -> treatment;
 }"""
 
+_CAUSAL_GRAPH_FLAT: str = CAUSAL_GRAPH.replace("\n", " ")
+
+FAST_PSM: str = "fast_psm"
+
+
+@functools.lru_cache(maxsize=8)
+def _make_model(
+    graph: str,
+    treatment: str,
+    outcome: str,
+    columns: tuple[str, ...],
+) -> dowhy.CausalModel:
+    """Build a data-free prototype CausalModel for a graph and column set.
+
+    DoWhy only consults the data's column names when parsing the graph, so
+    the parsed model can be shared by every dataset with the same columns.
+    """
+    return dowhy.CausalModel(
+        data=pd.DataFrame(columns=list(columns)),
+        graph=graph,
+        treatment=treatment,
+        outcome=outcome,
+    )
+
+
+def _bind_data(model: dowhy.CausalModel, data: pd.DataFrame) -> dowhy.CausalModel:
+    """Return a shallow copy of *model* bound to *data*."""
+    bound = copy.copy(model)
+    bound._data = data
+    bound._estimator_cache = {}
+    return bound
+
 
 @dataclass
 class RefutationResult:
@@ -67,14 +105,33 @@ class CausalAnalysis:
         self._data = data
         self._treatment = treatment
         self._outcome = outcome
-        self._graph = graph.replace("\n", " ")
-        self._model = dowhy.CausalModel(
-            data=self._data,
-            graph=self._graph,
+        self._graph = (
+            _CAUSAL_GRAPH_FLAT if graph == CAUSAL_GRAPH else graph.replace("\n", " ")
+        )
+        self._model = _bind_data(
+            _make_model(self._graph, treatment, outcome, tuple(data.columns)),
+            self._data,
+        )
+        self._result = AnalysisResult()
+
+    def clone_with_data(self, data: pd.DataFrame) -> CausalAnalysis:
+        """Return a fresh analysis on *data* that reuses the parsed graph.
+
+        Intended for bootstrap and sensitivity sweeps, where the same graph is
+        re-fit on many resampled cohorts.
+
+        Args:
+            data: Cohort-level DataFrame with the same columns as the original.
+
+        Returns:
+            A new :class:`CausalAnalysis` with an empty result.
+        """
+        return CausalAnalysis(
+            data=data,
             treatment=self._treatment,
             outcome=self._outcome,
+            graph=self._graph,
         )
-        self._result = AnalysisResult()
 
     @property
     def model(self) -> dowhy.CausalModel:
@@ -105,7 +162,9 @@ class CausalAnalysis:
         """Estimate the causal effect.
 
         Args:
-            method_name: DoWhy estimation method identifier.
+            method_name: DoWhy estimation method identifier.  An estimator
+                name of ``fast_psm`` (e.g. ``iv.fast_psm``) selects the
+                sorted-array propensity score matcher in :mod:`src.models._psm`.
             target_units: Target population for the estimate (``att``, ``ate``, ``atc``).
 
         Returns:
@@ -117,11 +176,29 @@ class CausalAnalysis:
         if self._result.estimand is None:
             raise RuntimeError("Call identify() before estimate().")
 
-        self._result.estimate = self._model.estimate_effect(
-            self._result.estimand,
-            method_name=method_name,
-            target_units=target_units,
-        )
+        identifier, _, estimator_name = method_name.partition(".")
+        if estimator_name == FAST_PSM:
+            # Mirror the setup CausalModel.estimate_effect does for its own
+            # estimators so get_estimator() and refuters see this one.
+            self._result.estimand.set_identifier_method(identifier)
+            estimator = FastPropensityScoreMatchingEstimator(self._result.estimand)
+            self._model._estimator_cache[method_name] = estimator
+            self._result.estimate = estimate_effect(
+                self._data,
+                self._treatment,
+                self._outcome,
+                identifier,
+                estimator,
+                target_units=target_units,
+                effect_modifiers=self._model.get_effect_modifiers(),
+                method_params={},
+            )
+        else:
+            self._result.estimate = self._model.estimate_effect(
+                self._result.estimand,
+                method_name=method_name,
+                target_units=target_units,
+            )
         self._result.ate = self._result.estimate.value
         return self._result.estimate
 
@@ -131,14 +208,20 @@ class CausalAnalysis:
         random_common_cause: bool = True,
         data_subset: bool = True,
         subset_fraction: float = 0.9,
+        n_jobs: int | None = None,
     ) -> list[RefutationResult]:
         """Run refutation tests on the estimated effect.
 
+        The refuters are independent re-estimations, so they run concurrently
+        in separate worker processes.
+
         Args:
             placebo: Run placebo treatment refuter.
             random_common_cause: Run random common cause refuter.
             data_subset: Run data subset refuter.
             subset_fraction: Fraction of data to use for subset test.
+            n_jobs: Number of worker processes (default: one per refuter,
+                capped at the CPU count).
 
         Returns:
             List of :class:`RefutationResult` objects.
@@ -150,26 +233,31 @@ class CausalAnalysis:
             raise RuntimeError("Call estimate() before refute().")
 
         refutations: list[RefutationResult] = []
-        refuters = []
+        refuters: list[tuple[str, str, dict[str, Any]]] = []
 
         if placebo:
-            refuters.append(("Placebo Treatment", "placebo_treatment_refuter"))
+            refuters.append(("Placebo Treatment", "placebo_treatment_refuter", {}))
         if random_common_cause:
-            refuters.append(("Random Common Cause", "random_common_cause"))
+            refuters.append(("Random Common Cause", "random_common_cause", {}))
         if data_subset:
-            refuters.append(("Data Subset", "data_subset_refuter"))
+            refuters.append(
+                ("Data Subset", "data_subset_refuter", {"subset_fraction": subset_fraction})
+            )
 
-        for name, method in refuters:
-            kwargs: dict[str, Any] = {}
-            if method == "data_subset_refuter":
-                kwargs["subset_fraction"] = subset_fraction
+        if n_jobs is None:
+            n_jobs = max(1, min(len(refuters), cpu_count()))
 
-            ref = self._model.refute_estimate(
+        results = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(self._model.refute_estimate)(
                 self._result.estimand,
                 self._result.estimate,
                 method_name=method,
                 **kwargs,
             )
+            for _, method, kwargs in refuters
+        )
+
+        for (name, _, _), ref in zip(refuters, results):
             refutations.append(
                 RefutationResult(
                     name=name,
@@ -7,6 +7,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def load_config(path: str | Path = "config/default.yaml") -> dict[str, Any]:
     """Load a YAML configuration file.
@@ -18,7 +23,7 @@ def load_config(path: str | Path = "config/default.yaml") -> dict[str, Any]:
         Parsed configuration dictionary.
     """
     with open(path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def print_section(title: str, width: int = 60) -> None:
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 
 def plot_dag(model, output_path: str | Path | None = None) -> None:
     """Render the causal DAG from a DoWhy CausalModel.
@@ -40,10 +44,16 @@ def plot_treatment_effect(
     Returns:
         The matplotlib Figure object.
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(8, 5))
+    outcome = data[outcome_col]
+    observed = outcome.notna().to_numpy()
+    values = outcome.to_numpy(dtype=float, na_value=np.nan)
+    treatment = data[treatment_col]
     groups = [
-        data.loc[data[treatment_col] == False, outcome_col].dropna(),  # noqa: E712
-        data.loc[data[treatment_col] == True, outcome_col].dropna(),   # noqa: E712
+        values[(treatment == False).to_numpy(bool, na_value=False) & observed],  # noqa: E712
+        values[(treatment == True).to_numpy(bool, na_value=False) & observed],   # noqa: E712
     ]
     ax.boxplot(groups, labels=["Control", "Treatment"])
     ax.set_ylabel(outcome_col)
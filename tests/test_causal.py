@@ -0,0 +1,103 @@
+"""Tests for the DoWhy causal model wrapper."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import dowhy
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.simulator import generate_and_aggregate
+from src.models.causal import CAUSAL_GRAPH, CausalAnalysis
+
+
+@pytest.fixture
+def cohorts() -> tuple[pd.DataFrame, pd.DataFrame]:
+    return (
+        generate_and_aggregate(num_users=2000, seed=0),
+        generate_and_aggregate(num_users=2000, seed=1),
+    )
+
+
+class TestCausalAnalysis:
+    """Tests for CausalAnalysis model caching and cloning."""
+
+    def test_matches_fresh_dowhy_model(self, cohorts: tuple[pd.DataFrame, pd.DataFrame]) -> None:
+        cohort, _ = cohorts
+        analysis = CausalAnalysis(cohort.copy())
+        analysis.identify()
+        analysis.estimate()
+
+        model = dowhy.CausalModel(
+            data=cohort.copy(),
+            graph=CAUSAL_GRAPH.replace("\n", " "),
+            treatment="treatment",
+            outcome="post_spends",
+        )
+        estimand = model.identify_effect(proceed_when_unidentifiable=True)
+        estimate = model.estimate_effect(
+            estimand,
+            method_name="iv.propensity_score_matching",
+            target_units="att",
+        )
+
+        assert analysis.result.ate == pytest.approx(estimate.value)
+
+    def test_clone_with_data_matches_fresh_analysis(self, cohorts: tuple[pd.DataFrame, pd.DataFrame]) -> None:
+        cohort, other = cohorts
+        original = CausalAnalysis(cohort.copy())
+        original.identify()
+        original.estimate()
+
+        clone = original.clone_with_data(other.copy())
+        clone.identify()
+        clone.estimate()
+
+        fresh = CausalAnalysis(other.copy())
+        fresh.identify()
+        fresh.estimate()
+
+        assert clone.result.ate == pytest.approx(fresh.result.ate)
+        assert clone.result.ate != pytest.approx(original.result.ate)
+
+    def test_estimator_cache_not_shared(self, cohorts: tuple[pd.DataFrame, pd.DataFrame]) -> None:
+        cohort, other = cohorts
+        first = CausalAnalysis(cohort.copy())
+        second = CausalAnalysis(other.copy())
+        assert first.model._graph is second.model._graph
+
+        first.identify()
+        first.estimate()
+
+        assert first.model._estimator_cache
+        assert not second.model._estimator_cache
+
+
+class TestRefute:
+    """Tests for CausalAnalysis.refute."""
+
+    @pytest.mark.parametrize(
+        "method_name",
+        ["backdoor.propensity_score_matching", "backdoor.fast_psm"],
+    )
+    def test_parallel_refuters(
+        self,
+        cohorts: tuple[pd.DataFrame, pd.DataFrame],
+        method_name: str,
+    ) -> None:
+        cohort, _ = cohorts
+        analysis = CausalAnalysis(cohort.copy())
+        analysis.identify()
+        analysis.estimate(method_name=method_name)
+
+        refutations = analysis.refute(placebo=False, n_jobs=2)
+
+        assert [ref.name for ref in refutations] == ["Random Common Cause", "Data Subset"]
+        for ref in refutations:
+            assert ref.estimated_effect == pytest.approx(analysis.result.ate)
+            assert np.isfinite(ref.new_effect)
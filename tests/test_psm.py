@@ -0,0 +1,59 @@
+"""Tests for the sorted-array propensity score matcher."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.simulator import generate_and_aggregate
+from src.models._psm import fast_psm
+from src.models.causal import CausalAnalysis
+
+
+class TestFastPsm:
+    """Tests for fast_psm."""
+
+    def test_matches_brute_force(self) -> None:
+        rng = np.random.default_rng(0)
+        propensities = rng.random(2000)
+        treatment = rng.random(2000) < 0.3
+        outcome = rng.normal(size=2000)
+
+        p_t, p_c = propensities[treatment], propensities[~treatment]
+        nearest = np.abs(p_t[:, None] - p_c[None, :]).argmin(axis=1)
+        expected = (outcome[treatment] - outcome[~treatment][nearest]).mean()
+
+        assert fast_psm(propensities, treatment, outcome) == pytest.approx(expected)
+
+    def test_exact_matches_recover_effect(self) -> None:
+        propensities = np.array([0.1, 0.5, 0.9, 0.1, 0.5, 0.9])
+        treatment = np.array([True, True, True, False, False, False])
+        outcome = np.array([11.0, 12.0, 13.0, 1.0, 2.0, 3.0])
+        assert fast_psm(propensities, treatment, outcome) == pytest.approx(10.0)
+
+
+class TestFastPsmEstimator:
+    """Tests for the fast_psm path through CausalAnalysis."""
+
+    @pytest.mark.parametrize("target_units", ["att", "atc", "ate"])
+    def test_matches_dowhy_matching(self, target_units: str) -> None:
+        cohort = generate_and_aggregate(num_users=2000, seed=0)
+        rng = np.random.default_rng(1)
+        cohort["propensity_score"] = rng.random(len(cohort))
+
+        fast = CausalAnalysis(cohort.copy())
+        fast.identify()
+        fast.estimate("backdoor.fast_psm", target_units=target_units)
+
+        reference = CausalAnalysis(cohort.copy())
+        reference.identify()
+        reference.estimate("backdoor.propensity_score_matching", target_units=target_units)
+
+        assert fast.result.ate == pytest.approx(reference.result.ate)
+        assert fast.result.estimand.identifier_method == "backdoor"
+        assert fast.model.get_estimator("backdoor.fast_psm") is not None
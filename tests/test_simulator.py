@@ -6,11 +6,17 @@ import sys
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.data.simulator import generate_raw_data, prepare_cohort_data
+from src.data import simulator
+from src.data.simulator import (
+    generate_and_aggregate,
+    generate_raw_data,
+    prepare_cohort_data,
+)
 
 
 class TestGenerateRawData:
@@ -39,6 +45,43 @@ class TestGenerateRawData:
         b = generate_raw_data(num_users=100, num_months=6, seed=99)
         assert a.equals(b)
 
+    def test_fractional_parameters(self) -> None:
+        raw = generate_raw_data(
+            num_users=100, num_months=6, month_decay_rate=2.5, treatment_effect=50.5, seed=0
+        )
+        assert raw["spend"].dtype == np.float64
+        assert (raw["spend"] % 1 != 0).any()
+
+    def test_whole_float_parameters(self) -> None:
+        expected = generate_raw_data(num_users=100, num_months=6, seed=0)
+        for decay, lift in [(10.0, 100), (10, 100.0), (np.float64(10), np.float64(100))]:
+            raw = generate_raw_data(
+                num_users=100,
+                num_months=6,
+                month_decay_rate=decay,
+                treatment_effect=lift,
+                seed=0,
+            )
+            pd.testing.assert_frame_equal(raw, expected)
+
+    def test_threaded_poisson_deterministic(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(simulator, "_POISSON_BLOCK", 64)
+        draws = [
+            simulator._poisson(np.random.Generator(np.random.PCG64DXSM(7)), 500, 1000)
+            for _ in range(2)
+        ]
+        assert draws[0].dtype == np.int32
+        assert len(draws[0]) == 1000
+        np.testing.assert_array_equal(draws[0], draws[1])
+
+        monkeypatch.setattr(simulator.os, "cpu_count", lambda: 1)
+        single = simulator._poisson(np.random.Generator(np.random.PCG64DXSM(7)), 500, 1000)
+        np.testing.assert_array_equal(single, draws[0])
+
+        a = generate_raw_data(num_users=100, num_months=6, seed=7)
+        b = generate_raw_data(num_users=100, num_months=6, seed=7)
+        assert a.equals(b)
+
 
 class TestPrepareCohortData:
     """Tests for prepare_cohort_data."""
@@ -58,3 +101,55 @@ class TestPrepareCohortData:
         raw = generate_raw_data(num_users=1000, num_months=12, seed=0)
         cohort = prepare_cohort_data(raw, signup_month=3)
         assert len(cohort) > 0
+
+    def test_pre_post_means(self) -> None:
+        raw = generate_raw_data(num_users=300, num_months=12, seed=7)
+        cohort = prepare_cohort_data(raw, signup_month=3).set_index("user_id")
+        for uid in cohort.index[:20]:
+            user = raw[raw.user_id == uid]
+            pre = user.loc[user.month < 3, "spend"].mean()
+            post = user.loc[user.month > 3, "spend"].mean()
+            assert cohort.loc[uid, "pre_spends"] == pytest.approx(pre)
+            assert cohort.loc[uid, "post_spends"] == pytest.approx(post)
+
+    def test_row_order_independent(self) -> None:
+        raw = generate_raw_data(num_users=300, num_months=12, seed=3)
+        shuffled = raw.sample(frac=1.0, random_state=0)
+        expected = prepare_cohort_data(raw, signup_month=3)
+        result = prepare_cohort_data(shuffled, signup_month=3)
+        pd.testing.assert_frame_equal(
+            result.sort_values("user_id").reset_index(drop=True),
+            expected.sort_values("user_id").reset_index(drop=True),
+        )
+
+    def test_unbalanced_panel(self) -> None:
+        raw = generate_raw_data(num_users=300, num_months=12, seed=5)
+        raw = raw[~((raw.user_id % 7 == 0) & (raw.month == 2))]
+        cohort = prepare_cohort_data(raw, signup_month=3).set_index("user_id")
+        for uid in cohort.index[:20]:
+            user = raw[raw.user_id == uid]
+            pre = user.loc[user.month < 3, "spend"].mean()
+            assert cohort.loc[uid, "pre_spends"] == pytest.approx(pre)
+
+
+class TestGenerateAndAggregate:
+    """Tests for generate_and_aggregate."""
+
+    def test_matches_two_step_single_chunk(self) -> None:
+        raw = generate_raw_data(num_users=500, num_months=12, seed=11)
+        expected = prepare_cohort_data(raw, signup_month=3)
+        result = generate_and_aggregate(num_users=500, num_months=12, seed=11)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_chunked_user_ids(self) -> None:
+        cohort = generate_and_aggregate(num_users=1003, seed=0, chunk_size=100)
+        assert cohort["user_id"].is_unique
+        assert cohort["user_id"].is_monotonic_increasing
+        assert cohort["user_id"].max() < 1003
+        assert set(cohort["signup_month"].unique()).issubset({0, 3})
+
+    def test_empty_population(self) -> None:
+        expected = prepare_cohort_data(generate_raw_data(num_users=0, seed=0))
+        result = generate_and_aggregate(num_users=0, seed=0)
+        assert len(result) == 0
+        pd.testing.assert_frame_equal(result, expected)